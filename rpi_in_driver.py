@@ -1,8 +1,6 @@
 import configparser
 import logging
-from logging import config
-
-import yaml
+import os
 
 from src.pi_to_pi.utility import set_up_pub_sub
 from src.raspberry_pi_driver.utility import (
@@ -11,28 +9,32 @@ from src.raspberry_pi_driver.utility import (
     hash_prefix,
 )
 from src.raspberry_pi_ui import rokku
+from src.utility import configure_logging
 
-# set up logger
-with open("logger_config.yaml", "r") as f:
-    log_config = yaml.safe_load(f.read())
-    config.dictConfig(log_config)
+# resolve files next to this script, regardless of the working directory
+ROOT: str = os.path.dirname(os.path.abspath(__file__))
 logger = logging.getLogger("RPI_IN")
 
 
 def main():
+    # set up logger
+    configure_logging()
+
     # parse command line argument
     args = command_line_parser("RPI_IN_DRIVER")
     prefix: str = hash_prefix(args.public_id)
 
     # parse configuration file
     app_config = configparser.ConfigParser()
-    app_config.read("./app_config.ini")
+    app_config.read(f"{ROOT}/app_config.ini")
     intercom_config = app_config["mumble"]
     video_config = app_config["video"]
 
     # set up pub sub
     logger.info("Setting up publisher and subscriber")
-    pub, msg_q, listen_proc = set_up_pub_sub(prefix, "in_to_out", "out_to_in")
+    pub, msg_q, listen_thread = set_up_pub_sub(
+        prefix, "in_to_out", "out_to_in"
+    )
     logger.info("Publisher and subscriber set up successfully!")
     try:
         logger.info("Spinning up UI...")
@@ -42,7 +44,7 @@ def main():
     except (KeyboardInterrupt, SystemExit):
         pass  # do nothing here because the code below completes the cleanup
 
-    clean_up(logger, processes=[listen_proc], cmds=[])
+    clean_up(logger, processes=[listen_thread], cmds=[])
     logger.info("\n******* rpi_in_driver ends *******\n")
 
 
@@ -1,14 +1,14 @@
 import configparser
 import json
 import logging
-from logging import config
+import os
 from multiprocessing import Process, Queue
-from time import sleep
+from queue import Empty
 
 import RPi.GPIO as GPIO
-import yaml
 
 from src.pi_to_pi.utility import set_up_pub_sub
+from src.raspberry_pi_alarm.buzzer_interface import Buzzer
 from src.raspberry_pi_camera.camera_interface import CameraInterface
 from src.raspberry_pi_driver.behaviors import (
     alarm,
@@ -25,29 +25,37 @@ from src.raspberry_pi_driver.utility import (
 )
 from src.raspberry_pi_intercom.togglemute_button import start_togglemute_proc
 from src.raspberry_pi_motion_sensor.motion_interface import MotionPir
+from src.utility import configure_logging
 
-# set up logger
-with open("logger_config.yaml", "r") as f:
-    log_config = yaml.safe_load(f.read())
-    config.dictConfig(log_config)
+# resolve files next to this script, regardless of the working directory
+ROOT: str = os.path.dirname(os.path.abspath(__file__))
 logger = logging.getLogger("RPI_OUT")
 
 
 def main():
+    # set up logger
+    configure_logging()
+
     # parse command line argument
     args = command_line_parser("RPI_OUT_DRIVER")
     prefix: str = hash_prefix(args.public_id)
 
     # parse configuration file
     app_config = configparser.ConfigParser()
-    app_config.read("./app_config.ini")
+    app_config.read(f"{ROOT}/app_config.ini")
     intercom_config = app_config["mumble"]
     motion_sensor_config = app_config["motion_sensor"]
     video_config = app_config["video"]
 
+    # Run mute button in separate process. Start it before pub sub, so that it
+    # is not forked while the MQTT clients' network threads are running.
+    togglemute_proc = start_togglemute_proc(logger)
+
     # set up pub sub
     logger.info("Setting up publisher and subscriber")
-    pub, msg_q, listen_proc = set_up_pub_sub(prefix, "out_to_in", "in_to_out")
+    pub, msg_q, listen_thread = set_up_pub_sub(
+        prefix, "out_to_in", "in_to_out"
+    )
     logger.info("Publisher and subscriber set up successfully!")
 
     # set up flag for camera
@@ -61,17 +69,23 @@ def main():
     sensor = MotionPir(motion_queue, motion_pin, led_pin, motion_sensor_config)
     led_proc = None  # placeholder for process lighting up LED.
 
-    # Run mute button in separate process
-    togglemute_proc = start_togglemute_proc(logger)
+    # set up alarm
+    alarm_pin = 6  # GPIO6 is connected to the buzzer
+    buzzer = Buzzer(alarm_pin)
 
     try:
         # forever listening on topic "{prefix}/in_to_out"
         while True:
-            if not msg_q.empty():
-                msg: str = msg_q.get()
+            # block until a message arrives, but wake up every second to check
+            # on the motion sensor
+            try:
+                msg: str = msg_q.get(timeout=1)
+            except Empty:
+                msg = ""
+            if msg:
                 identifier, flag = json.loads(msg)
                 if identifier == "alarm":
-                    alarm.alarm(pub, flag)
+                    alarm.alarm(pub, flag, buzzer)
                 elif identifier == "intercom":
                     intercom.intercom(pub, flag, intercom_config, logger)
                 elif identifier == "motion":
@@ -95,14 +109,17 @@ def main():
                 # change rpi_in's UI (use should NOT be able to interact with
                 # UI when the alert is on)
                 sensor.set_disarmed()
+                # Forking while the MQTT network threads run is safe here: the
+                # child only drives the LED pin via sensor.led_on(), and never
+                # touches the MQTT clients or queues whose locks those threads
+                # may hold at fork time.
                 led_proc = Process(
                     target=sensor.led_on, name="LED proc", args=()
                 )
                 led_proc.start()
-            sleep(1)
     except (KeyboardInterrupt, SystemExit):
         logger.warning("Termination signal sensed.")
-        clean_up(logger, processes=[listen_proc, togglemute_proc], cmds=[])
+        clean_up(logger, processes=[listen_thread, togglemute_proc], cmds=[])
     logger.info("\n******* rpi_out_driver ends *******\n")
     GPIO.cleanup()
 
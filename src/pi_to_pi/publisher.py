@@ -1,10 +1,9 @@
 import logging
-import logging.config
-import os
 from time import sleep
 
 import paho.mqtt.client as mqtt
-import yaml
+
+from src.utility import configure_logging
 
 
 class Publisher:
@@ -31,10 +30,7 @@ class Publisher:
         self.client.loop_start()
 
         # set up logger
-        fname: str = f"{os.path.dirname(__file__)}/../../logger_config.yaml"
-        with open(fname, "r") as f:
-            config = yaml.safe_load(f.read())
-            logging.config.dictConfig(config)
+        configure_logging()
         self.logger = logging.getLogger("Publisher")
 
     def publish(self, msg: str) -> None:
@@ -1,10 +1,9 @@
 import logging
-import logging.config
-import os
 from time import sleep
 
 import paho.mqtt.client as mqtt
-import yaml
+
+from src.utility import configure_logging
 
 
 class Subscriber:
@@ -33,15 +32,13 @@ class Subscriber:
         self.client.connect(broker_address, port=port)
 
         # set up logger
-        fname: str = f"{os.path.dirname(__file__)}/../../logger_config.yaml"
-        with open(fname, "r") as f:
-            config = yaml.safe_load(f.read())
-            logging.config.dictConfig(config)
+        configure_logging()
         self.logger = logging.getLogger("Subscriber")
 
     def start_listen(self):
         """
-        This function must be run in a child process, as it is blocking.
+        This function must be run in a child process or thread, as it is
+        blocking.
         """
         self.client.loop_forever()
         self.logger.debug(f"Start listening on topic {self.topic}")
@@ -0,0 +1,18 @@
+from queue import SimpleQueue
+from time import sleep
+
+from .. import subscriber
+from ..utility import ListenThread
+
+
+def test_listen_thread_terminate():
+    sub = subscriber.Subscriber(SimpleQueue())
+    # Run the listening function of subscriber in a thread
+    listen_thread = ListenThread(sub)
+    listen_thread.start()
+    sleep(1)
+    # terminate() disconnects the client, which must end the thread
+    listen_thread.terminate()
+    listen_thread.join(timeout=10)
+    # Test
+    assert not listen_thread.is_alive()
@@ -1,32 +1,59 @@
-from multiprocessing import Process, Queue
+from queue import SimpleQueue
+from threading import Thread
 
 from src.pi_to_pi import publisher, subscriber
 
 
+class ListenThread(Thread):
+    """
+    A thread running the subscriber's blocking listening loop.
+
+    It provides the same terminate() and join() interface as
+    multiprocessing.Process, such that it can be cleaned up the same way.
+    """
+
+    def __init__(self, sub: subscriber.Subscriber):
+        super().__init__(
+            name="Subscriber's Listening Thread",
+            target=sub.start_listen,
+            daemon=True,
+        )
+        self.sub = sub
+
+    def terminate(self) -> None:
+        """
+        Stop listening. Disconnecting the client makes the listening loop
+        return, which ends the thread.
+        """
+        self.sub.close()
+
+
 def set_up_pub_sub(prefix: str, pub_suffix: str, sub_suffix: str):
     """
     Utility function to set up pub and sub, using 'prefix/pub_suffix' as the
     topic for publishing, and 'prefix/sub_suffix' as the topic for subscription.
 
+    The subscriber listens in a thread instead of a child process. It is I/O
+    bound, and a thread avoids pickling every message through a
+    multiprocessing queue.
+
     Args:
         prefix:     A 64-bit hashed string, generated by user-input public_id
                     and an internal salt.
         pub_suffix: Suffix for the publishing topic.
         sub_suffix: Suffix for the subscription topic
     Return:
-        publihser object, message queue, and a listening process for subscriber
+        publihser object, message queue, and a listening thread for subscriber
     Raises:
         None
     """
     # publisher from rpi_in to rpi_out
     pub = publisher.Publisher(topic=f"{prefix}/{pub_suffix}")
-    msg_q = Queue()
+    msg_q = SimpleQueue()
     # subscriber listening messages from rpi_out to rpi_in
     sub = subscriber.Subscriber(msg_q, topic=f"{prefix}/{sub_suffix}")
-    # listen in a separate process
-    listen_proc = Process(
-        name="Subscriber's Listening Process", target=sub.start_listen, args=()
-    )
-    listen_proc.start()
+    # listen in a separate thread
+    listen_thread = ListenThread(sub)
+    listen_thread.start()
 
-    return pub, msg_q, listen_proc
+    return pub, msg_q, listen_thread
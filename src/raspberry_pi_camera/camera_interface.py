@@ -90,15 +90,13 @@ class CameraInterface(object):
     path in future iterations."""
 
     def record_video(self):
-        filename = (
-            self.save_location
-            + datetime.datetime.now().strftime("%I:%M:%S%p on %B %d, %Y")
-            + ".h264"
-        )
+        # Take the timestamp once so the saved file and the upload title
+        # always agree, even when the clock ticks over in between.
         self.last_recording = (
             datetime.datetime.now().strftime("%I:%M:%S%p on %B %d, %Y")
             + ".h264"
         )
+        filename = self.save_location + self.last_recording
         camera = PiCamera()
         camera.resolution = self.modes[self.resolution]
         camera.start_recording(filename)
@@ -112,7 +110,7 @@ class CameraInterface(object):
 
     def start_mjpg_streamer(self):
         # String of start stream shell script
-        cmd = "./start_stream.sh"
+        cmd = f"{self.path}/start_stream.sh"
 
         # Object to start and capture the shell command
         temp = subprocess.Popen([cmd], stdout=subprocess.PIPE)
@@ -121,11 +119,10 @@ class CameraInterface(object):
         # print("View the stream at http://<your-raspberry-pi-ip-address>:9000/" +
         # "?action=stream or http://127.0.0.1:9000/?action=stream")
 
-        # Catches and prints all the output from the shell script
-        output = str(temp.communicate())
-        output = output.split("\\n")
-        for i in range(1, len(output) - 1, 1):
-            print(output[i])
+        # Streams and prints the output from the shell script line by line
+        for line in temp.stdout:
+            print(line.decode("utf-8", errors="replace").rstrip())
+        temp.wait()
 
         return "http://" + socket.gethostname() + ":9000/?action=stream"
 
@@ -134,7 +131,7 @@ class CameraInterface(object):
 
     def stop_mjpg_streamer(self):
         # String of start stream shell script
-        cmd = "./stop_stream.sh"
+        cmd = f"{self.path}/stop_stream.sh"
 
         # Object to start and capture the shell command
         temp = subprocess.Popen([cmd], stdout=subprocess.PIPE)
@@ -142,11 +139,10 @@ class CameraInterface(object):
         # The stream should be stopped; the link to make sure
         # print("mjpg_streamer was stopped")
 
-        # Catches and prints all the output from the shell script
-        output = str(temp.communicate())
-        output = output.split("\\n")
-        for i in range(1, len(output) - 1, 1):
-            print(output[i])
+        # Streams and prints the output from the shell script line by line
+        for line in temp.stdout:
+            print(line.decode("utf-8", errors="replace").rstrip())
+        temp.wait()
 
     """This returns a boolean after checking if mjpg_streamer is running."""
 
@@ -155,7 +151,7 @@ class CameraInterface(object):
         catch = False
 
         # String of start stream shell script
-        cmd = "./check_stream.sh"
+        cmd = f"{self.path}/check_stream.sh"
 
         # Object to start and capture the shell command
         temp = subprocess.Popen([cmd], stdout=subprocess.PIPE)
@@ -163,12 +159,13 @@ class CameraInterface(object):
         # The stream should be stopped; the link to make sure
         # print("mjpg_streamer was stopped")
 
-        # Catches and prints all the output from the shell script
-        output = str(temp.communicate())
-        output = output.split("\\n")
-        for i in range(1, len(output) - 1, 1):
-            if output[i] == "mjpg_streamer running":
+        # Streams the output from the shell script and stops reading as soon
+        # as the status line shows up
+        for line in temp.stdout:
+            if line.strip() == b"mjpg_streamer running":
                 catch = True
+                break
+        temp.communicate()  # drain the rest of the output and reap the script
 
         return catch
 
@@ -178,9 +175,9 @@ class CameraInterface(object):
 
     def start_yt_stream(self):
         # String of start stream shell script
-        cmd = f"{os.path.dirname(__file__)}/start_livestream.sh"
+        cmd = f"{self.path}/start_livestream.sh"
         # Object to start and capture the shell command
-        subprocess.Popen(cmd, shell=True)
+        subprocess.Popen([cmd])
 
         return self.yt_livestream_link
 
@@ -190,8 +187,8 @@ class CameraInterface(object):
 
     def stop_yt_stream(self):
         # String of start stream shell script
-        kill_livestream = "tmux kill-sess -t livestream"
-        subprocess.run(kill_livestream, shell=True)
+        kill_livestream = ["tmux", "kill-sess", "-t", "livestream"]
+        subprocess.run(kill_livestream)
         # Forcefully free up camera
         camera = PiCamera()
         camera.close()
@@ -200,28 +197,27 @@ class CameraInterface(object):
     upload a video from the given filepath."""
 
     def upload_to_yt(self, filepath):
-        # Making the command line script
-        cmd = (
-            f'python {self.path}/upload_video.py --file="'
-            + filepath
-            + '"'
-            + ' --title="Date: '
-            + self.last_recording
-            + '"'
-            + ' --description="A recording from raspi_out."'
-            + ' --keywords="school,technology"'
-            + ' --category="22"'
-            + ' --privacyStatus="unlisted"'
-        )
-
-        # Passing the command to the shell
-        temp = subprocess.Popen(["bash", "-c", cmd], stdout=subprocess.PIPE)
-
-        # Catches and prints all the output from the shell script
-        output = str(temp.communicate())
-        output = output.split("\\n")
-        for i in range(1, len(output) - 1, 1):
-            print(output[i])
+        # Making the command line arguments. Passing them as a list, instead
+        # of a string through bash, avoids spawning an extra shell and the
+        # need to quote the file name and title.
+        cmd = [
+            "python",
+            f"{self.path}/upload_video.py",
+            f"--file={filepath}",
+            f"--title=Date: {self.last_recording}",
+            "--description=A recording from raspi_out.",
+            "--keywords=school,technology",
+            "--category=22",
+            "--privacyStatus=unlisted",
+        ]
+
+        # Run the upload script
+        temp = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+
+        # Streams and prints the output from the shell script line by line
+        for line in temp.stdout:
+            print(line.decode("utf-8", errors="replace").rstrip())
+        temp.wait()
 
     # Getters and setters
     """Returns int of the object's video length."""
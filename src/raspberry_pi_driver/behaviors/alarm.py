@@ -1,14 +1,15 @@
 import json
 
-from src.raspberry_pi_alarm.buzzer_interface import Buzzer
 
+def alarm(pub, flag, buzzer) -> None:
+    """Behavior that will set off alarm on rpi_out.
 
-def alarm(pub, flag) -> None:
-    """Behavior that will set off alarm on rpi_out."""
-    alarm_pin = 6
-    alarm_ = Buzzer(alarm_pin)
+    :param pub:     MQTT publisher object.
+    :param flag:    True to sound the alarm, False to silence it.
+    :param buzzer:  Buzzer object driving the alarm.
+    """
     if flag:
-        alarm_.sound()
+        buzzer.sound()
     else:
-        alarm_.silence()
-    pub.publish(json.dumps(["alarm", alarm_.get_state()]))
+        buzzer.silence()
+    pub.publish(json.dumps(["alarm", buzzer.get_state()]))
@@ -1,8 +1,9 @@
 import argparse
 from hashlib import blake2b
-from time import sleep
 from typing import Any, List
 
+SALT = b"sYEuhMrWC6"  # User MUST change this SALT
+
 
 def command_line_parser(prog_name: str):
     """
@@ -41,7 +42,6 @@ def hash_prefix(public_id: str) -> str:
     Raises:
         None
     """
-    SALT = "sYEuhMrWC6".encode("utf-8")  # User MUST change this SALT
     h_addr = blake2b(digest_size=32, salt=SALT)
     h_addr.update(public_id.encode("utf-8"))
     return h_addr.hexdigest()
@@ -55,9 +55,7 @@ def terminate_proc(proc, logger) -> None:
     """
     logger.info(f"Terminating {proc.name}...")
     proc.terminate()
-    while proc.is_alive():
-        sleep(1)
-    proc.join()
+    proc.join()  # blocks until the process has exited
     logger.info(f"{proc.name} terminated successfully!")
 
 
@@ -71,9 +69,7 @@ def terminate_cmd(cmd_proc, cmd_name, logger) -> None:
     """
     logger.info(f"Terminating {cmd_name}...")
     cmd_proc.kill()
-    while cmd_proc.poll() is None:
-        sleep(1)
-    cmd_proc.wait()
+    cmd_proc.wait()  # blocks until the command process has exited
     logger.info(f"{cmd_name} terminated successfully!")
 
 
@@ -2,6 +2,7 @@ import logging
 import os
 import subprocess
 from time import sleep
+from typing import List
 
 import gi
 
@@ -26,14 +27,18 @@ def turn_on(config, name: str, logger: logging.Logger) -> None:
     port: str = config["PORT"]
     channel: str = config["CHANNEL"]
     logger.info("Turning on Mumble client...")
-    cmd: str = (
-        f"{os.path.dirname(__file__)}/start_mumble.sh "
-        f"-n {name} "
-        f"-h {host} "
-        f"-p {port} "
-        f"-c {channel}"
-    )
-    subprocess.Popen(cmd, shell=True)  # Use Popen for non-blocking
+    cmd: List[str] = [
+        f"{os.path.dirname(__file__)}/start_mumble.sh",
+        "-n",
+        name,
+        "-h",
+        host,
+        "-p",
+        port,
+        "-c",
+        channel,
+    ]
+    subprocess.Popen(cmd)  # Use Popen for non-blocking
 
 
 def is_on(logger: logging.Logger, timeout: int = 20) -> bool:
@@ -47,12 +52,9 @@ def is_on(logger: logging.Logger, timeout: int = 20) -> bool:
     mumble_on: bool = False
     timer: int = 0
     while timer <= timeout:
-        outs: bytes = subprocess.check_output(
-            "ps -ef | grep -c mumble", shell=True
-        )
-        # when stabilized, there should be three lines containing "mumble", one
-        # from the mumble client process, and the other two from grepping.
-        if outs.decode("utf-8").strip() == "3":
+        # when stabilized, the mumble client should be the only process with
+        # "mumble" in its command line.
+        if _count_procs("mumble") == 1:
             mumble_on = True
             break
         while gtk.events_pending():  # make the loop non-blocking on UI
@@ -66,16 +68,43 @@ def is_on(logger: logging.Logger, timeout: int = 20) -> bool:
     return mumble_on
 
 
+def _count_procs(keyword: str) -> int:
+    """Count running processes whose command line contains keyword.
+
+    /proc is read directly with os.open/os.read, which is much cheaper than
+    spawning `ps -ef | grep` on every check.
+
+    :param keyword: Keyword to look for in each process' command line.
+    :return: Number of processes whose command line contains keyword.
+    """
+    target: bytes = keyword.encode("utf-8")
+    count: int = 0
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY)
+            try:
+                cmdline: bytes = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+        except OSError:  # process exited while we were scanning
+            continue
+        if target in cmdline:
+            count += 1
+    return count
+
+
 def turn_off(logger) -> bool:
     """Turn off mumble client via command line
 
     :param logger:  For logging purpose
     :return: True if mumble client successfully turned off, else False
     """
-    kill_intercom = "tmux kill-sess -t intercom"
+    kill_intercom: List[str] = ["tmux", "kill-sess", "-t", "intercom"]
     logger.info("Turning off rpi_in Mumble CLI client...")
     try:
-        mum_proc = subprocess.run(kill_intercom, shell=True)
+        mum_proc = subprocess.run(kill_intercom)
     except Exception:
         logger.exception("ERROR: unable to turn off Mumble client")
         mum_proc = None
@@ -0,0 +1,21 @@
+import shlex
+import subprocess
+from time import sleep
+
+from src.raspberry_pi_intercom.mumble import _count_procs
+
+
+def test_count_procs():
+    """Spawning a process with a unique argument adds exactly one count.
+
+    Compare against a baseline, because the shell that launched the tests may
+    carry the keyword in its own command line.
+    """
+    keyword = "4242.4242"
+    before = _count_procs(keyword)
+    test_cmd = subprocess.Popen(shlex.split(f"sleep {keyword}"))
+    sleep(1)  # give the child time to exec
+    res = _count_procs(keyword)
+    test_cmd.kill()
+    test_cmd.wait()
+    assert res - before == 1 and _count_procs(keyword) == before
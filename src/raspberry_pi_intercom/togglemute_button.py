@@ -1,8 +1,8 @@
 import logging
 import shlex
 import subprocess
-import time
 from multiprocessing import Process
+from threading import Event
 
 import RPi.GPIO as GPIO
 
@@ -23,9 +23,18 @@ def togglemute(logger: logging.Logger) -> None:
     # Output pin connected to LED. High leads to LED on, while low off.
     GPIO.setup(output_pin, GPIO.OUT)
     mute: bool = True  # flag
+    # Edge detection stays armed the whole time, so a press or release that
+    # happens while a `mumble rpc` call is running is not lost. No bouncetime:
+    # a bounce only costs an extra read of the pin, whereas a debounced
+    # release could leave the mic live.
+    edge = Event()
+    GPIO.add_event_detect(
+        input_pin, GPIO.BOTH, callback=lambda channel: edge.set()
+    )
 
     try:
         while True:
+            edge.clear()  # clear before reading, so no edge slips in between
             input_state = GPIO.input(input_pin)
             if input_state:  # input high, button released
                 GPIO.output(output_pin, GPIO.LOW)  # turn off LED
@@ -39,7 +48,8 @@ def togglemute(logger: logging.Logger) -> None:
                     subprocess.run(shlex.split("mumble rpc unmute"))  # unmute
                     mute = False
                     logger.debug("Mumble client UNMUTE")
-            time.sleep(0.1)
+            # sleep until the button changes state instead of polling it
+            edge.wait()
     except KeyboardInterrupt:
         logger.info("keyboard interruption.")
     finally:
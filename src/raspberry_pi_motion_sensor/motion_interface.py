@@ -1,12 +1,11 @@
 import logging
-import os
 from collections import deque
-from logging import config
-from time import time
+from time import monotonic
 from typing import Deque
 
 import RPi.GPIO as GPIO
-import yaml
+
+from src.utility import configure_logging
 
 
 class MotionPir:
@@ -49,11 +48,7 @@ class MotionPir:
         self.trigger_times = None
 
         # set up logger
-        with open(
-            f"{os.path.dirname(__file__)}/../../logger_config.yaml", "r"
-        ) as f_obj:
-            log_config = yaml.safe_load(f_obj.read())
-            config.dictConfig(log_config)
+        configure_logging()
         self.logger = logging.getLogger("MOTION_SENSOR")
 
     def motion_callback(self, channel):
@@ -64,7 +59,7 @@ class MotionPir:
         called anytime the Pir sensor is activated. Gives main driver ability
         to see callback from different thread.
         """
-        curr_time = time()
+        curr_time = monotonic()
         earliest_time = self.trigger_times.popleft()
         self.trigger_times.append(curr_time)
         self.logger.debug("*** PIR Triggered ***")
@@ -1,13 +1,10 @@
 import json
 import logging
-import logging.config
-import os
-
-import yaml
 
 from src.raspberry_pi_ui import message_box
 from src.raspberry_pi_ui.buttons.button import Button
 from src.raspberry_pi_ui.utility import set_button_property, wait_msg
+from src.utility import configure_logging
 
 
 class AlarmButton(Button):
@@ -24,11 +21,7 @@ class AlarmButton(Button):
         self.alarm_sounding = False
         self.alarm_sounding_out = False
         # set up logger
-        with open(
-            f"{os.path.dirname(__file__)}/../../../logger_config.yaml", "r"
-        ) as f:
-            config = yaml.safe_load(f.read())
-            logging.config.dictConfig(config)
+        configure_logging()
         self.logger = logging.getLogger("AlarmButton")
 
     def on_clicked(self, widget):
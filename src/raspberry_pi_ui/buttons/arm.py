@@ -1,11 +1,7 @@
 import json
 import logging
-import logging.config
-import os
 from time import sleep
 
-import yaml
-
 from src.raspberry_pi_ui import message_box
 from src.raspberry_pi_ui.buttons.button import Button
 from src.raspberry_pi_ui.utility import (
@@ -13,6 +9,7 @@ from src.raspberry_pi_ui.utility import (
     set_button_property,
     wait_msg,
 )
+from src.utility import configure_logging
 
 
 class ArmButton(Button):
@@ -30,11 +27,7 @@ class ArmButton(Button):
         self.armed_out = False
 
         # set up logger
-        with open(
-            f"{os.path.dirname(__file__)}/../../../logger_config.yaml", "r"
-        ) as f:
-            config = yaml.safe_load(f.read())
-            logging.config.dictConfig(config)
+        configure_logging()
         self.logger = logging.getLogger("ArmButton")
 
     def on_clicked(self, widget):
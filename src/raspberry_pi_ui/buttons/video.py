@@ -1,12 +1,9 @@
 # import json
 import logging
-import logging.config
-import os
-
-import yaml
 
 from src.raspberry_pi_ui import embedded_yt
 from src.raspberry_pi_ui.buttons.button import Button
+from src.utility import configure_logging
 
 # from src.raspberry_pi_ui.utility import set_button_property, wait_msg
 
@@ -24,11 +21,7 @@ class VideoButton(Button):
         self.yt_videos_link = yt_playlist_link
 
         # set up logger
-        with open(
-            f"{os.path.dirname(__file__)}/../../../logger_config.yaml", "r"
-        ) as f:
-            config = yaml.safe_load(f.read())
-            logging.config.dictConfig(config)
+        configure_logging()
         self.logger = logging.getLogger("VideoButton")
 
     def on_clicked(self, widget):
@@ -1,9 +1,7 @@
 import logging
-import logging.config
 import os
 
 import gi
-import yaml
 
 gi.require_version("Gtk", "3.0")
 gi.require_version("Gdk", "3.0")
@@ -19,6 +17,7 @@ from src.raspberry_pi_ui.buttons import (
     livestream,
     video,
 )
+from src.utility import configure_logging
 
 
 class Main:
@@ -50,11 +49,7 @@ class Main:
         )
 
         # set up logger
-        with open(
-            f"{os.path.dirname(__file__)}/../../logger_config.yaml", "r"
-        ) as f:
-            config = yaml.safe_load(f.read())
-            logging.config.dictConfig(config)
+        configure_logging()
         self.logger = logging.getLogger("UI")
 
         # set up flag for camera
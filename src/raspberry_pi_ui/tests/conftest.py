@@ -27,15 +27,15 @@ def mqtt_out():
     )
     yield mqtt_out
     print("tear down mqtt_out")
-    _, _, out_listen_proc = mqtt_out
-    out_listen_proc.terminate()
-    out_listen_proc.join()
+    _, _, out_listen_thread = mqtt_out
+    out_listen_thread.terminate()
+    out_listen_thread.join()
 
 
 @pytest.fixture(scope="package")
 def button():
     """Set up button via ui."""
-    in_pub, in_msg_q, in_listen_proc = set_up_pub_sub(
+    in_pub, in_msg_q, in_listen_thread = set_up_pub_sub(
         hash_prefix("Rokku/test_topic"), "in_to_out", "out_to_in"
     )
     app_config = configparser.ConfigParser()
@@ -48,8 +48,8 @@ def button():
     yield ui.talk_button
     print("tear down button via UI")
     ui.close_application("", "")
-    in_listen_proc.terminate()
-    in_listen_proc.join()
+    in_listen_thread.terminate()
+    in_listen_thread.join()
 
 
 @pytest.fixture(scope="package")
@@ -15,7 +15,7 @@ def empty_queues(out_msg_q, in_msg_q):
 
 def test_button_publish(mqtt_out, button):
     """Test message sent from in to out."""
-    out_pub, out_msg_q, out_listen_proc = mqtt_out
+    out_pub, out_msg_q, out_listen_thread = mqtt_out
     empty_queues(out_msg_q, button.msg_q)
     button.pub.publish(json.dumps(["test_4", True]))
     while out_msg_q.empty():
@@ -17,7 +17,7 @@ def empty_queues(out_msg_q, in_msg_q):
 
 def test_wait_msg_normal(mqtt_out, button, logger):
     """Essentially, we are testing message sent from out to in."""
-    out_pub, out_msg_q, out_listen_proc = mqtt_out
+    out_pub, out_msg_q, out_listen_thread = mqtt_out
     empty_queues(out_msg_q, button.msg_q)
     out_pub.publish(json.dumps(["test_1", True]))
     in_received_list = wait_msg("test_1", logger, button.msg_q)
@@ -26,7 +26,7 @@ def test_wait_msg_normal(mqtt_out, button, logger):
 
 def test_wait_msg_timeout(mqtt_out, button, logger):
     """Test timeout functionality of wait_msg()."""
-    out_pub, out_msg_q, out_listen_proc = mqtt_out
+    out_pub, out_msg_q, out_listen_thread = mqtt_out
     empty_queues(out_msg_q, button.msg_q)
     in_received_list = wait_msg("test_2", logger, button.msg_q, timeout=1)
     sleep(2)
@@ -39,7 +39,7 @@ def test_wait_msg_wrong_id(mqtt_out, button, logger):
     currently being expected from in. We should not receive anything and the
     in_msg_q should still contain the unmatched message
     """
-    out_pub, out_msg_q, out_listen_proc = mqtt_out
+    out_pub, out_msg_q, out_listen_thread = mqtt_out
     empty_queues(out_msg_q, button.msg_q)
     sent_list = ["foo", True]
     out_pub.publish(json.dumps(sent_list))
@@ -1,9 +1,10 @@
 import json
 import os
-from time import time
+from time import monotonic
 from typing import Any, List
 from time import sleep
 import subprocess
+from threading import Thread
 
 import gi
 
@@ -70,10 +71,10 @@ def wait_msg(identifier: str, logger, msg_q, timeout: int = 10) -> List[Any]:
                         function. Default timeout set to 10 seconds.
     :return: A json-loaded object (or empty list) from the received message.
     """
-    start = time()
+    start = monotonic()
     msg_list = []
     while True:
-        if time() - start >= timeout:
+        if monotonic() - start >= timeout:
             logger.error("Wait for rpi_out message timeout.")
             break
         if not msg_q.empty():
@@ -91,13 +92,25 @@ def play_notification_sound(repeats: int, logger):
     """
     Plays a sound from a .wav file within sounds.
 
+    Playback does not block. A daemon thread waits for aplay to finish, reaps
+    it and logs its return code.
+
     :param repeats: Number of times notification sound will be played
 
     :param logger: Logs when an audio message is played.
     """
     audio_dir = os.path.dirname(__file__) + "/static/audio/notify.wav"
-    rep: int = 0
-    while rep <= repeats:
-        play = subprocess.run(["aplay", "-q", audio_dir], check=True)
-        rep += 1
-    logger.info(f"Notification sound: {play}")
+    # aplay plays its file arguments back to back, so a single call covers
+    # all repeats instead of spawning one aplay per repeat. Use Popen for
+    # non-blocking, such that the caller can bring up its alert while the
+    # sound is playing.
+    play = subprocess.Popen(["aplay", "-q"] + [audio_dir] * (repeats + 1))
+
+    def wait_play():
+        returncode = play.wait()
+        if returncode:
+            logger.error(f"Notification sound failed: aplay exit {returncode}")
+        else:
+            logger.info(f"Notification sound: played {repeats + 1} time(s)")
+
+    Thread(target=wait_play, name="Notification Sound", daemon=True).start()
@@ -0,0 +1,35 @@
+import logging
+import os
+
+from src import utility
+from src.utility import PROJECT_ROOT, configure_logging, load_yaml
+
+FIXTURE = f"{os.path.dirname(__file__)}/fixtures/test_logger_config.yaml"
+
+
+def test_load_yaml():
+    res = load_yaml(FIXTURE)
+    assert res["version"] == 1 and "TESET" in res["loggers"]
+
+
+def test_configure_logging_once(monkeypatch):
+    """A second call, even with another config, must not replace handlers."""
+    monkeypatch.setattr(utility, "_configured", False)
+    configure_logging()
+    handlers = list(logging.getLogger("Publisher").handlers)
+    configure_logging()
+    configure_logging(FIXTURE)
+    assert handlers and logging.getLogger("Publisher").handlers == handlers
+
+
+def test_configure_logging_log_path(monkeypatch, tmp_path):
+    """The log file lands in the project root, not the working directory."""
+    monkeypatch.setattr(utility, "_configured", False)
+    monkeypatch.chdir(tmp_path)
+    configure_logging()
+    file_handlers = [
+        h
+        for h in logging.getLogger("Publisher").handlers
+        if isinstance(h, logging.FileHandler)
+    ]
+    assert file_handlers[0].baseFilename == f"{PROJECT_ROOT}/rokku.log"
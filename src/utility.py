@@ -0,0 +1,53 @@
+import logging.config
+import os
+from typing import Any
+
+import yaml
+
+# Prefer the libyaml-backed loader, which is much faster than the pure-Python
+# one. Fall back to the latter if PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+PROJECT_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOGGER_CONFIG: str = f"{PROJECT_ROOT}/logger_config.yaml"
+
+_configured: bool = False  # whether logging has been configured already
+
+
+def load_yaml(fname: str) -> Any:
+    """Safely load a YAML file.
+
+    :param fname:   Path to the YAML file.
+    :return: The Python object represented by the YAML file.
+    """
+    with open(fname, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def configure_logging(fname: str = LOGGER_CONFIG) -> None:
+    """Configure logging from a YAML file, once per process.
+
+    Only the first call parses the file and applies it. Later calls are
+    no-ops regardless of fname, so every component can call this when it sets
+    up its logger without re-opening rokku.log or replacing handlers.
+
+    Relative log file names are resolved against the project root, so logs
+    end up in the same place whatever the working directory is.
+
+    :param fname:   Path to the logger config file. Default to the project's
+                    logger_config.yaml.
+    """
+    global _configured
+    if _configured:
+        return
+    log_config = load_yaml(fname)
+    for handler in log_config.get("handlers", {}).values():
+        if "filename" in handler:
+            handler["filename"] = os.path.join(
+                PROJECT_ROOT, handler["filename"]
+            )
+    logging.config.dictConfig(log_config)
+    _configured = True